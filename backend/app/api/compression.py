@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import gzip
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:  # brotli is optional; without it only gzip is offered.
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+# Bodies smaller than this are sent uncompressed; the framing overhead is not worth it.
+DEFAULT_MINIMUM_SIZE = 1024
+# Server-sent events must reach the client as soon as they are written.
+_PASSTHROUGH_MEDIA_TYPES = ("text/event-stream",)
+
+
+def _compress(body: bytes, encoding: str, gzip_level: int, brotli_quality: int) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+
+
+def _negotiate(accept_encoding: str) -> Optional[str]:
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding] = quality
+
+    candidates = ["br", "gzip"] if brotli is not None else ["gzip"]
+    best: Optional[str] = None
+    best_quality = 0.0
+    for coding in candidates:
+        quality = accepted.get(coding, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+class _Encoder:
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int) -> None:
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._zlib = zlib.compressobj(gzip_level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def chunk(self, data: bytes) -> bytes:
+        # Flush per chunk so streamed rows are decodable by the client right away.
+        if self.encoding == "br":
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.finish()
+        return self._zlib.flush()
+
+
+class CompressionMiddleware:
+    """Negotiates `br` (when the brotli package is installed) or `gzip` response compression.
+
+    Unlike Starlette's GZipMiddleware, streamed bodies are flushed chunk by chunk,
+    so NDJSON rows are not held back until the compressor's buffer fills up.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = DEFAULT_MINIMUM_SIZE,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = _negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Optional[Message] = None
+        encoder: Optional[_Encoder] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, encoder, passthrough
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                media_type = headers.get("content-type", "").split(";", 1)[0].strip()
+                passthrough = "content-encoding" in headers or media_type in _PASSTHROUGH_MEDIA_TYPES
+                if passthrough:
+                    await send(message)
+                else:
+                    # Hold the start message until the first body chunk decides the framing.
+                    start_message = message
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if start_message is not None:
+                start, start_message = start_message, None
+                if not more_body and len(body) < self.minimum_size:
+                    await send(start)
+                    await send(message)
+                    passthrough = True
+                    return
+
+                headers = MutableHeaders(raw=start["headers"])
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if more_body:
+                    encoder = _Encoder(encoding, self.gzip_level, self.brotli_quality)
+                    del headers["Content-Length"]
+                    await send(start)
+                    await send(
+                        {"type": "http.response.body", "body": encoder.chunk(body), "more_body": True}
+                    )
+                else:
+                    payload = _compress(body, encoding, self.gzip_level, self.brotli_quality)
+                    headers["Content-Length"] = str(len(payload))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": payload})
+                return
+
+            assert encoder is not None
+            if more_body:
+                await send(
+                    {"type": "http.response.body", "body": encoder.chunk(body), "more_body": True}
+                )
+            else:
+                await send(
+                    {"type": "http.response.body", "body": encoder.chunk(body) + encoder.finish()}
+                )
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from ..providers.dispatch import ModelDispatcher
+from ..providers.ollama import OllamaProvider
+
+# Shared by every route so model affinity spans chat, compare and any other generation caller.
+provider = ModelDispatcher(OllamaProvider())
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Iterator
+
+from fastapi import Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# Rows per streamed chunk after the first one; the first row is always sent on its own.
+NDJSON_BATCH_SIZE = 100
+
+
+def json_response(adapter: TypeAdapter, content: Any, status_code: int = 200) -> Response:
+    """Encode `content` with pydantic-core's native serializer.
+
+    Skips FastAPI's default jsonable_encoder + json.dumps pass, which walks
+    every field in Python and dominates on large catalogs and long outputs.
+    """
+    return Response(
+        content=adapter.dump_json(content),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def wants_ndjson(request: Request) -> bool:
+    accept = request.headers.get("accept", "")
+    return any(
+        part.split(";", 1)[0].strip().lower() == NDJSON_MEDIA_TYPE for part in accept.split(",")
+    )
+
+
+def ndjson_response(first: BaseModel, rest: Iterator[BaseModel]) -> StreamingResponse:
+    """Stream `first` followed by `rest` as newline-delimited JSON.
+
+    Errors raised while iterating `rest` can no longer change the status code,
+    so they end the stream with a `{"type": "error", "detail": ...}` line. Data
+    rows never carry a `type` key, so clients can tell the two apart.
+    """
+
+    def lines() -> Iterator[bytes]:
+        yield first.model_dump_json().encode("utf-8") + b"\n"
+        batch: list[bytes] = []
+        try:
+            for item in rest:
+                batch.append(item.model_dump_json().encode("utf-8"))
+                if len(batch) >= NDJSON_BATCH_SIZE:
+                    yield b"\n".join(batch) + b"\n"
+                    batch = []
+        except (OSError, ValueError) as exc:
+            # OSError covers a file removed between listing the directory and reading it.
+            batch.append(json.dumps({"type": "error", "detail": str(exc)}).encode("utf-8"))
+        if batch:
+            yield b"\n".join(batch) + b"\n"
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
@@ -8,10 +8,10 @@ from fastapi import APIRouter, HTTPException
 
 from ..core.types import ChatMessage, ChatRequest, ChatResponse
 from ..providers.base import ProviderError, ProviderUnavailableError
-from ..providers.ollama import OllamaProvider
+from ..providers.dispatch import GenerationTiming
+from .deps import provider
 
 router = APIRouter()
-provider = OllamaProvider()
 logger = logging.getLogger(__name__)
 
 
@@ -41,36 +41,45 @@ async def run_chat(request: ChatRequest) -> ChatResponse:
         request.model,
         params_dump,
     )
+    # Latency covers the generation itself; time spent queued behind other models is queue_ms.
+    timing = GenerationTiming()
     try:
-        assistant_output = provider.generate(
-            model=request.model, messages=messages, params=request.params
+        assistant_output = await provider.generate(
+            model=request.model, messages=messages, params=request.params, timing=timing
         )
     except ProviderUnavailableError as exc:
-        latency_ms = int((time.monotonic() - started_at) * 1000)
         logger.warning(
-            "chat error model=%s params=%s latency_ms=%s error_type=%s",
+            "chat error model=%s params=%s latency_ms=%s queue_ms=%s error_type=%s",
             request.model,
             params_dump,
-            latency_ms,
+            timing.latency_ms(),
+            timing.queue_ms(),
             exc.__class__.__name__,
         )
         raise HTTPException(status_code=503, detail="Ollama is not running or unreachable.") from exc
     except ProviderError as exc:
-        latency_ms = int((time.monotonic() - started_at) * 1000)
         logger.warning(
-            "chat error model=%s params=%s latency_ms=%s error_type=%s",
+            "chat error model=%s params=%s latency_ms=%s queue_ms=%s error_type=%s",
             request.model,
             params_dump,
-            latency_ms,
+            timing.latency_ms(),
+            timing.queue_ms(),
             exc.__class__.__name__,
         )
         raise HTTPException(status_code=502, detail=str(exc) or "Failed to generate response.") from exc
 
-    latency_ms = int((time.monotonic() - started_at) * 1000)
+    latency_ms = timing.latency_ms()
+    queue_ms = timing.queue_ms()
     logger.info(
-        "chat response model=%s params=%s latency_ms=%s",
+        "chat response model=%s params=%s latency_ms=%s queue_ms=%s",
         request.model,
         params_dump,
         latency_ms,
+        queue_ms,
+    )
+    return ChatResponse(
+        assistant_output=assistant_output,
+        model=request.model,
+        latency_ms=latency_ms,
+        queue_ms=queue_ms,
     )
-    return ChatResponse(assistant_output=assistant_output, model=request.model, latency_ms=latency_ms)
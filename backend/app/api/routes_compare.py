@@ -1,20 +1,22 @@
 from __future__ import annotations
 
-import time
-
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
+from pydantic import TypeAdapter
 
 from ..core.types import ChatMessage, CompareItemResult, CompareRequest, CompareResponse
 from ..providers.base import ProviderError, ProviderUnavailableError
-from ..providers.ollama import OllamaProvider
+from ..providers.dispatch import GenerationTiming
 from ..storage.prompts_fs import get_prompt
+from .deps import provider
+from .responses import json_response
 
 router = APIRouter()
-provider = OllamaProvider()
+
+_COMPARE_ADAPTER = TypeAdapter(CompareResponse)
 
 
 @router.post("/compare", response_model=CompareResponse)
-async def compare_prompts(request: CompareRequest) -> CompareResponse:
+async def compare_prompts(request: CompareRequest) -> Response:
     if not request.model or not request.model.strip():
         raise HTTPException(status_code=400, detail="Model is required.")
     if not request.user_input or not request.user_input.strip():
@@ -36,40 +38,45 @@ async def compare_prompts(request: CompareRequest) -> CompareResponse:
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    def run_generation(prompt) -> CompareItemResult:
-        started_at = time.monotonic()
+    async def run_generation(prompt) -> CompareItemResult:
+        # Latency is measured from when the dispatcher starts the job, so A and B stay
+        # comparable even if one of them queued behind another model.
+        timing = GenerationTiming()
         messages = [
             ChatMessage(role="system", content=prompt.body_md),
             ChatMessage(role="user", content=request.user_input),
         ]
 
         try:
-            assistant_output = provider.generate(
-                model=request.model, messages=messages, params=request.params
+            assistant_output = await provider.generate(
+                model=request.model, messages=messages, params=request.params, timing=timing
             )
         except ProviderUnavailableError:
             raise
         except ProviderError as exc:
-            latency_ms = int((time.monotonic() - started_at) * 1000)
             return CompareItemResult(
                 prompt_id=prompt.id,
                 prompt_name=prompt.name,
                 assistant_output=None,
                 error=str(exc) or "Failed to generate response.",
-                latency_ms=latency_ms,
+                latency_ms=timing.latency_ms(),
+                queue_ms=timing.queue_ms(),
             )
 
-        latency_ms = int((time.monotonic() - started_at) * 1000)
         return CompareItemResult(
             prompt_id=prompt.id,
             prompt_name=prompt.name,
             assistant_output=assistant_output,
-            latency_ms=latency_ms,
+            latency_ms=timing.latency_ms(),
+            queue_ms=timing.queue_ms(),
         )
 
     try:
-        results = [run_generation(prompt_a), run_generation(prompt_b)]
+        results = [await run_generation(prompt_a), await run_generation(prompt_b)]
     except ProviderUnavailableError as exc:
         raise HTTPException(status_code=503, detail="Ollama is not running or unreachable.") from exc
 
-    return CompareResponse(model=request.model, input=request.user_input, results=results)
+    return json_response(
+        _COMPARE_ADAPTER,
+        CompareResponse(model=request.model, input=request.user_input, results=results),
+    )
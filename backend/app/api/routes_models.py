@@ -1,10 +1,10 @@
 from fastapi import APIRouter, HTTPException
 
 from ..providers.base import ModelInfo, ProviderUnavailableError, ProviderError
-from ..providers.ollama import OllamaProvider
+from ..providers.dispatch import DispatchStats
+from .deps import provider
 
 router = APIRouter()
-provider = OllamaProvider()
 
 
 @router.get("/models", response_model=dict[str, list[ModelInfo]])
@@ -17,3 +17,8 @@ async def list_models() -> dict[str, list[ModelInfo]]:
         raise HTTPException(status_code=500, detail="Failed to fetch models from provider.") from exc
 
     return {"models": models}
+
+
+@router.get("/models/dispatch", response_model=DispatchStats)
+async def dispatch_stats() -> DispatchStats:
+    return provider.stats()
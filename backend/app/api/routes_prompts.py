@@ -1,39 +1,102 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional
 
-from fastapi import APIRouter, HTTPException, Response
+from fastapi import APIRouter, Header, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
-from ..core.types import PromptMeta, PromptTemplate
+from ..core.types import PromptChangeEvent, PromptMeta, PromptTemplate
 from ..storage.prompts_fs import (
     create_prompt,
     delete_prompt,
     get_prompt,
+    iter_prompts,
     list_prompts,
     update_prompt,
 )
+from ..storage.prompts_watch import PromptWatcher
+from .responses import json_response, ndjson_response, wants_ndjson
 
 router = APIRouter()
+watcher = PromptWatcher()
+
+# Idle SSE connections get a comment line this often so proxies keep them open.
+CHANGES_HEARTBEAT_SECONDS = 15.0
+
+_PROMPT_LIST_ADAPTER = TypeAdapter(Dict[str, List[PromptMeta]])
+_PROMPT_ADAPTER = TypeAdapter(Dict[str, PromptTemplate])
+
+
+def _format_sse(event: PromptChangeEvent) -> str:
+    return f"id: {event.token}\nevent: {event.type}\ndata: {event.model_dump_json()}\n\n"
 
 
 @router.get("/prompts", response_model=Dict[str, List[PromptMeta]])
-async def list_prompts_endpoint(query: Optional[str] = None) -> Dict[str, List[PromptMeta]]:
+async def list_prompts_endpoint(request: Request, query: Optional[str] = None) -> Response:
+    if wants_ndjson(request):
+        # One PromptMeta per line, so the first rows arrive before the whole catalog is parsed.
+        prompts_iter = iter_prompts(query=query)
+        try:
+            first = await asyncio.to_thread(next, prompts_iter, None)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        if first is None:
+            return Response(media_type="application/x-ndjson")
+        return ndjson_response(first, prompts_iter)
+
     try:
         prompts = list_prompts(query=query)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    return {"prompts": prompts}
+    return json_response(_PROMPT_LIST_ADAPTER, {"prompts": prompts})
+
+
+@router.get("/prompts/changes")
+async def prompt_changes_endpoint(
+    request: Request,
+    since: Optional[str] = None,
+    last_event_id: Optional[str] = Header(default=None),
+) -> StreamingResponse:
+    # EventSource resends the last seen id on reconnect; an explicit ?since= wins.
+    token = since or last_event_id
+
+    async def stream() -> AsyncIterator[str]:
+        async with watcher.subscription():
+            seq = watcher.resume_seq(token)
+            if seq is None:
+                reset = watcher.reset_event()
+                seq = reset.seq
+                yield _format_sse(reset)
+            else:
+                # Hand out a token immediately so a client can resume even if nothing changes.
+                yield f"id: {watcher.current_token() if token is None else token}\n\n"
+            while not await request.is_disconnected():
+                events = await watcher.wait_for_events(seq, CHANGES_HEARTBEAT_SECONDS)
+                if not events:
+                    yield ": keepalive\n\n"
+                    continue
+                for event in events:
+                    yield _format_sse(event)
+                seq = events[-1].seq
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/prompts/{prompt_id}", response_model=Dict[str, PromptTemplate])
-async def get_prompt_endpoint(prompt_id: str) -> Dict[str, PromptTemplate]:
+async def get_prompt_endpoint(prompt_id: str) -> Response:
     try:
         prompt = get_prompt(prompt_id)
     except FileNotFoundError as exc:
         raise HTTPException(status_code=404, detail="Prompt not found.") from exc
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    return {"prompt": prompt}
+    return json_response(_PROMPT_ADAPTER, {"prompt": prompt})
 
 
 @router.post("/prompts", response_model=Dict[str, PromptTemplate], status_code=201)
@@ -49,6 +49,7 @@ class ChatResponse(BaseModel):
     assistant_output: str
     model: str
     latency_ms: Optional[int] = None
+    queue_ms: Optional[int] = None
 
 
 class CompareRequest(BaseModel):
@@ -65,6 +66,7 @@ class CompareItemResult(BaseModel):
     assistant_output: Optional[str] = None
     error: Optional[str] = None
     latency_ms: Optional[int] = None
+    queue_ms: Optional[int] = None
 
 
 class CompareResponse(BaseModel):
@@ -87,3 +89,14 @@ class PromptTemplate(BaseModel):
     model_defaults: GenerationParams = Field(default_factory=GenerationParams)
     body_md: str
     updated_at: Optional[str] = None
+
+
+PromptChangeType = Literal["created", "modified", "deleted", "reset"]
+
+
+class PromptChangeEvent(BaseModel):
+    seq: int
+    token: str
+    type: PromptChangeType
+    prompt_id: Optional[str] = None
+    prompt: Optional[PromptMeta] = None
@@ -1,14 +1,27 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from .api.compression import CompressionMiddleware
+from .api.deps import provider
 from .api.routes_chat import router as chat_router
 from .api.routes_compare import router as compare_router
 from .api.routes_models import router as models_router
 from .api.routes_prompts import router as prompts_router
+from .api.routes_prompts import watcher as prompts_watcher
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # The watcher only runs while /prompts/changes has subscribers; this drops its loop state.
+    await prompts_watcher.stop()
+    provider.close()
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="Prompt Canvas API")
+    app = FastAPI(title="Prompt Canvas API", lifespan=lifespan)
 
     # Allow frontend (dev) to call backend directly, bypassing Next.js proxy timeout
     app.add_middleware(
@@ -21,6 +34,8 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    # gzip/br for large catalog and compare payloads; SSE responses pass through untouched.
+    app.add_middleware(CompressionMiddleware)
 
     app.include_router(models_router)
     app.include_router(chat_router)
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import itertools
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+from pydantic import BaseModel
+
+from .base import ModelInfo, Provider
+from ..core.types import ChatMessage, GenerationParams
+
+# Longest a queued generation may wait for the active model's queue to drain (milliseconds).
+# Override via OLLAMA_MODEL_MAX_WAIT_MS; 0 disables affinity and dispatches strictly in order.
+DEFAULT_MODEL_MAX_WAIT_MS = 2000
+
+logger = logging.getLogger(__name__)
+
+
+class DispatchStats(BaseModel):
+    active_model: Optional[str] = None
+    in_flight: int = 0
+    queued: Dict[str, int] = {}
+    dispatched: int = 0
+    swaps: int = 0
+    max_wait_ms: int
+    max_parallel: int
+
+
+@dataclass
+class GenerationTiming:
+    """Filled in by `ModelDispatcher.generate` so callers can tell queue wait from run time."""
+
+    enqueued_at: float = field(default_factory=time.monotonic)
+    started_at: Optional[float] = None
+
+    def queue_ms(self) -> int:
+        end = self.started_at if self.started_at is not None else time.monotonic()
+        return int((end - self.enqueued_at) * 1000)
+
+    def latency_ms(self) -> int:
+        if self.started_at is None:
+            return 0
+        return int((time.monotonic() - self.started_at) * 1000)
+
+
+@dataclass
+class _Job:
+    model: str
+    order: int
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class ModelDispatcher:
+    """Groups queued generations by model so the provider swaps models as rarely as possible.
+
+    Generations for the model that is already loaded run first; a generation for
+    another model waits until that queue drains, or until it has waited
+    `max_wait_ms`, whichever comes first. Different models never run concurrently.
+
+    Queued generations wait on the event loop; only the ones that are started
+    occupy a thread, on the dispatcher's own executor.
+    """
+
+    def __init__(
+        self,
+        provider: Provider,
+        max_wait_ms: Optional[int] = None,
+        max_parallel: int = 1,
+    ) -> None:
+        self.provider = provider
+        if max_wait_ms is None:
+            max_wait_str = os.environ.get("OLLAMA_MODEL_MAX_WAIT_MS", "")
+            if max_wait_str.strip().isdigit():
+                max_wait_ms = int(max_wait_str.strip())
+            else:
+                max_wait_ms = DEFAULT_MODEL_MAX_WAIT_MS
+        self.max_wait_ms = max_wait_ms
+        self.max_parallel = max(1, max_parallel)
+        # Both are created on first use and dropped by close(), so the dispatcher can be
+        # reused by a later event loop (e.g. a second app lifespan).
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._condition: Optional[asyncio.Condition] = None
+        self._counter = itertools.count()
+        self._queue: List[_Job] = []
+        self._active_model: Optional[str] = None
+        self._in_flight = 0
+        self._dispatched = 0
+        self._swaps = 0
+        self._pending_releases: Set[asyncio.Task] = set()
+
+    def list_models(self) -> List[ModelInfo]:
+        return self.provider.list_models()
+
+    async def generate(
+        self,
+        model: str,
+        messages: List[ChatMessage],
+        params: GenerationParams,
+        timing: Optional[GenerationTiming] = None,
+    ) -> str:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_parallel, thread_name_prefix="model-dispatch"
+            )
+        condition = self._condition
+
+        job = _Job(model=model, order=next(self._counter))
+        async with condition:
+            self._queue.append(job)
+            try:
+                while not self._can_start(job):
+                    timeout = self._wait_timeout()
+                    if timeout is None:
+                        await condition.wait()
+                        continue
+                    try:
+                        await asyncio.wait_for(condition.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+            except asyncio.CancelledError:
+                # The caller went away (e.g. client disconnect); never run its job.
+                self._queue.remove(job)
+                condition.notify_all()
+                raise
+            self._start(job)
+
+        if timing is not None:
+            timing.started_at = time.monotonic()
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            self._executor,
+            functools.partial(self.provider.generate, model=model, messages=messages, params=params),
+        )
+        try:
+            return await asyncio.shield(future)
+        finally:
+            if future.done():
+                await self._release(condition)
+            else:
+                # Cancelled mid-generation: the thread keeps the provider busy until it returns.
+                future.add_done_callback(functools.partial(self._release_later, condition))
+
+    def close(self) -> None:
+        """Shut down the executor and drop loop-bound state; the next generate() starts afresh."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._condition = None
+        self._queue.clear()
+        self._in_flight = 0
+        self._pending_releases.clear()
+
+    def stats(self) -> DispatchStats:
+        queued: Dict[str, int] = {}
+        for job in self._queue:
+            queued[job.model] = queued.get(job.model, 0) + 1
+        return DispatchStats(
+            active_model=self._active_model,
+            in_flight=self._in_flight,
+            queued=queued,
+            dispatched=self._dispatched,
+            swaps=self._swaps,
+            max_wait_ms=self.max_wait_ms,
+            max_parallel=self.max_parallel,
+        )
+
+    async def _release(self, condition: asyncio.Condition) -> None:
+        if condition is not self._condition:
+            # close() ran since this job started; its slot was already reset.
+            return
+        async with condition:
+            self._in_flight -= 1
+            condition.notify_all()
+
+    def _release_later(self, condition: asyncio.Condition, future: asyncio.Future) -> None:
+        task = asyncio.ensure_future(self._release(condition))
+        self._pending_releases.add(task)
+        task.add_done_callback(self._pending_releases.discard)
+
+    def _next_job(self) -> Optional[_Job]:
+        if not self._queue:
+            return None
+        oldest = min(self._queue, key=lambda job: job.order)
+        if oldest.model == self._active_model:
+            return oldest
+
+        deadline = time.monotonic() - self.max_wait_ms / 1000
+        if oldest.enqueued_at <= deadline:
+            return oldest
+
+        same_model = [job for job in self._queue if job.model == self._active_model]
+        if same_model:
+            return min(same_model, key=lambda job: job.order)
+        return oldest
+
+    def _can_start(self, job: _Job) -> bool:
+        if self._in_flight >= self.max_parallel:
+            return False
+        if self._in_flight and job.model != self._active_model:
+            return False
+        return self._next_job() is job
+
+    def _wait_timeout(self) -> Optional[float]:
+        # Only an upcoming max-wait deadline needs a timed wake-up; every other state
+        # change (a job starting, finishing or being withdrawn) notifies the condition.
+        if not self._queue:
+            return None
+        oldest = min(self._queue, key=lambda job: job.order)
+        if oldest.model == self._active_model:
+            return None
+        remaining = oldest.enqueued_at + self.max_wait_ms / 1000 - time.monotonic()
+        return remaining if remaining > 0 else None
+
+    def _start(self, job: _Job) -> None:
+        self._queue.remove(job)
+        if job.model != self._active_model:
+            if self._active_model is not None:
+                self._swaps += 1
+                logger.info(
+                    "dispatch swap from=%s to=%s swaps=%s queued=%s",
+                    self._active_model,
+                    job.model,
+                    self._swaps,
+                    len(self._queue),
+                )
+            self._active_model = job.model
+        self._in_flight += 1
+        self._dispatched += 1
+        # Other waiters may now be eligible (same model, parallel slots free).
+        self._condition.notify_all()
@@ -4,7 +4,7 @@ import os
 import re
 from datetime import date
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 import yaml
 
@@ -19,6 +19,10 @@ def _prompts_dir() -> Path:
     return Path(os.getenv("PROMPTS_DIR", default_dir)).expanduser().resolve()
 
 
+def get_prompts_dir() -> Path:
+    return _prompts_dir()
+
+
 def _ensure_prompts_dir() -> Path:
     prompts_dir = _prompts_dir()
     prompts_dir.mkdir(parents=True, exist_ok=True)
@@ -124,19 +128,22 @@ def _load_prompt_from_path(path: Path) -> PromptTemplate:
     return template
 
 
-def list_prompts(query: str | None = None) -> list[PromptMeta]:
+def load_prompt_meta(path: Path) -> PromptMeta:
+    template = _load_prompt_from_path(path)
+    return PromptMeta(
+        id=template.id,
+        name=template.name,
+        tags=template.tags,
+        updated_at=template.updated_at,
+    )
+
+
+def iter_prompts(query: str | None = None) -> Iterator[PromptMeta]:
     prompts_dir = _ensure_prompts_dir()
     query_norm = query.lower().strip() if query else ""
-    results: list[PromptMeta] = []
 
     for path in sorted(prompts_dir.glob("*.md")):
-        template = _load_prompt_from_path(path)
-        meta = PromptMeta(
-            id=template.id,
-            name=template.name,
-            tags=template.tags,
-            updated_at=template.updated_at,
-        )
+        meta = load_prompt_meta(path)
         if query_norm:
             haystack = " ".join(
                 [
@@ -147,9 +154,11 @@ def list_prompts(query: str | None = None) -> list[PromptMeta]:
             )
             if query_norm not in haystack:
                 continue
-        results.append(meta)
+        yield meta
 
-    return results
+
+def list_prompts(query: str | None = None) -> list[PromptMeta]:
+    return list(iter_prompts(query=query))
 
 
 def get_prompt(prompt_id: str) -> PromptTemplate:
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from ..core.types import PromptChangeEvent, PromptMeta
+from .prompts_fs import get_prompts_dir, load_prompt_meta
+
+# How often the prompts directory is re-scanned (seconds). Override via PROMPTS_WATCH_INTERVAL.
+DEFAULT_WATCH_INTERVAL = 1.0
+# Number of past events kept so reconnecting clients can resume without a full reload.
+DEFAULT_HISTORY_SIZE = 1024
+
+logger = logging.getLogger(__name__)
+
+_Signature = tuple[int, int]
+
+
+class PromptWatcher:
+    """Watches the prompts directory and publishes per-prompt change events.
+
+    Change detection only stats the `*.md` files on each tick; a file is parsed
+    again only when its mtime or size changed, so the cost of keeping clients in
+    sync does not grow with the number of subscribers. The directory is only
+    scanned while at least one subscriber holds a `subscription()`.
+    """
+
+    def __init__(
+        self,
+        interval: Optional[float] = None,
+        history_size: int = DEFAULT_HISTORY_SIZE,
+    ) -> None:
+        if interval is None:
+            interval_str = os.environ.get("PROMPTS_WATCH_INTERVAL", "").strip()
+            try:
+                interval = float(interval_str) if interval_str else DEFAULT_WATCH_INTERVAL
+            except ValueError:
+                interval = DEFAULT_WATCH_INTERVAL
+            if interval <= 0:
+                interval = DEFAULT_WATCH_INTERVAL
+        self.interval = interval
+        # Tokens from a previous process must not resume against this one.
+        self._epoch = format(time.time_ns(), "x")
+        self._seq = 0
+        self._history: deque[PromptChangeEvent] = deque(maxlen=history_size)
+        self._signatures: dict[Path, _Signature] = {}
+        self._ids: dict[Path, str] = {}
+        # A cancelled tick can leave a scan running in its thread while the next one starts.
+        self._scan_lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._primed = False
+        self._subscribers = 0
+        # Loop-bound; created on first use and dropped by stop().
+        self._condition: Optional[asyncio.Condition] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _token(self, seq: int) -> str:
+        return f"{self._epoch}-{seq}"
+
+    def _parse_token(self, token: str) -> Optional[int]:
+        epoch, _, seq = token.strip().rpartition("-")
+        if epoch != self._epoch or not seq.isdigit():
+            return None
+        return int(seq)
+
+    def current_token(self) -> str:
+        return self._token(self._seq)
+
+    def resume_seq(self, token: Optional[str]) -> Optional[int]:
+        """Return the sequence number to resume after, or None if a reload is required."""
+        if not token:
+            return self._seq
+        seq = self._parse_token(token)
+        if seq is None or seq > self._seq:
+            return None
+        oldest = self._history[0].seq if self._history else self._seq + 1
+        if seq < oldest - 1:
+            return None
+        return seq
+
+    def reset_event(self) -> PromptChangeEvent:
+        return PromptChangeEvent(seq=self._seq, token=self.current_token(), type="reset")
+
+    @asynccontextmanager
+    async def subscription(self) -> AsyncIterator[None]:
+        """Keep the watcher running while the caller is subscribed."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._subscribers == 0:
+                await self._start()
+            self._subscribers += 1
+        try:
+            yield
+        finally:
+            # Synchronous on purpose: this runs while the subscriber is being cancelled.
+            self._subscribers -= 1
+            if self._subscribers == 0 and self._task is not None:
+                self._task.cancel()
+                self._task = None
+
+    async def stop(self) -> None:
+        """Stop scanning and drop loop-bound state so a later event loop can start it again."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._subscribers = 0
+        self._condition = None
+        self._lock = None
+
+    async def _start(self) -> None:
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        if not self._primed:
+            # Only record stat signatures and ids; parsing every template here would
+            # hold up the first subscriber on large catalogs.
+            await asyncio.to_thread(self._prime)
+            self._primed = True
+        else:
+            # Resuming after an idle period: report what changed in the meantime.
+            changes = await asyncio.to_thread(self._scan)
+            if changes:
+                await self._publish(changes)
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                changes = await asyncio.to_thread(self._scan)
+            except Exception:  # pragma: no cover - runtime failure path
+                logger.exception("prompt watch scan failed")
+                continue
+            if changes:
+                await self._publish(changes)
+
+    def _stat_prompts(self) -> dict[Path, _Signature]:
+        current: dict[Path, _Signature] = {}
+        try:
+            with os.scandir(get_prompts_dir()) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".md") or not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    current[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            pass
+        return current
+
+    def _prime(self) -> None:
+        with self._scan_lock:
+            self._signatures = self._stat_prompts()
+            # Prompt files are named after their id, so the stem stands in until the file changes.
+            self._ids = {path: path.stem for path in self._signatures}
+
+    def _scan(self) -> list[tuple[str, str, Optional[PromptMeta]]]:
+        with self._scan_lock:
+            return self._scan_locked()
+
+    def _scan_locked(self) -> list[tuple[str, str, Optional[PromptMeta]]]:
+        current = self._stat_prompts()
+
+        changes: list[tuple[str, str, Optional[PromptMeta]]] = []
+
+        for path in sorted(self._signatures.keys() - current.keys()):
+            del self._signatures[path]
+            prompt_id = self._ids.pop(path, None)
+            if prompt_id is not None:
+                changes.append(("deleted", prompt_id, None))
+
+        for path in sorted(current):
+            signature = current[path]
+            if self._signatures.get(path) == signature:
+                continue
+            self._signatures[path] = signature
+            try:
+                meta = load_prompt_meta(path)
+            except (OSError, ValueError) as exc:
+                # Typically a half-written file; it is picked up again on the next write.
+                logger.warning("prompt watch skipped path=%s error=%s", path.name, exc)
+                continue
+
+            previous_id = self._ids.get(path)
+            self._ids[path] = meta.id
+            if previous_id is None:
+                changes.append(("created", meta.id, meta))
+            elif previous_id != meta.id:
+                changes.append(("deleted", previous_id, None))
+                changes.append(("created", meta.id, meta))
+            else:
+                changes.append(("modified", meta.id, meta))
+
+        return changes
+
+    async def _publish(self, changes: list[tuple[str, str, Optional[PromptMeta]]]) -> None:
+        assert self._condition is not None
+        async with self._condition:
+            for change_type, prompt_id, meta in changes:
+                self._seq += 1
+                self._history.append(
+                    PromptChangeEvent(
+                        seq=self._seq,
+                        token=self._token(self._seq),
+                        type=change_type,
+                        prompt_id=prompt_id,
+                        prompt=meta,
+                    )
+                )
+            self._condition.notify_all()
+
+    async def wait_for_events(self, after_seq: int, timeout: float) -> list[PromptChangeEvent]:
+        """Return events newer than `after_seq`, waiting up to `timeout` seconds for one."""
+        assert self._condition is not None
+        async with self._condition:
+            if self._seq <= after_seq:
+                try:
+                    await asyncio.wait_for(
+                        self._condition.wait_for(lambda: self._seq > after_seq), timeout
+                    )
+                except asyncio.TimeoutError:
+                    return []
+            if self._history and self._history[0].seq > after_seq + 1:
+                # The subscriber fell behind the retained history; it has to reload.
+                return [self.reset_event()]
+            return [event for event in self._history if event.seq > after_seq]
@@ -0,0 +1,179 @@
+"""Benchmark JSON encoding, compression and NDJSON streaming on a large prompt catalog.
+
+Usage (from repo root):
+
+    python -m backend.benchmarks.bench_payloads [--prompts 10000] [--repeat 5]
+
+Generates a temporary catalog, then drives the ASGI app directly so time to
+first byte can be measured without a network stack in the way.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+BODY_MD = "You are a careful assistant. Follow the rubric below.\n\n" + "- Keep answers precise.\n" * 200
+
+
+def _write_catalog(prompts_dir: Path, count: int) -> None:
+    for idx in range(count):
+        prompt_id = f"prompt_{idx:05d}"
+        (prompts_dir / f"{prompt_id}.md").write_text(
+            "---\n"
+            f"id: {prompt_id}\n"
+            f"name: Prompt {idx}\n"
+            "tags:\n- bench\n- catalog\n"
+            "model_defaults:\n  temperature: 0.2\n"
+            "updated_at: '2025-12-17'\n"
+            "---\n\n"
+            f"{BODY_MD}",
+            encoding="utf-8",
+        )
+
+
+async def _asgi_get(app, path: str, headers: Dict[str, str]) -> tuple[float, float, int]:
+    """Return (time to first body byte, total time, body size) for a GET request."""
+    query = ""
+    if "?" in path:
+        path, query = path.split("?", 1)
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        "client": ("127.0.0.1", 0),
+        "server": ("127.0.0.1", 8000),
+    }
+    started_at = time.perf_counter()
+    first_byte: Optional[float] = None
+    size = 0
+
+    request_sent = False
+    disconnected = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # Streaming responses listen for a disconnect; the client never leaves mid-response.
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal first_byte, size
+        if message["type"] == "http.response.body":
+            body = message.get("body", b"")
+            if body and first_byte is None:
+                first_byte = time.perf_counter()
+            size += len(body)
+
+    await app(scope, receive, send)
+    finished_at = time.perf_counter()
+    return (first_byte or finished_at) - started_at, finished_at - started_at, size
+
+
+def _median_ms(samples: List[float]) -> float:
+    return statistics.median(samples) * 1000
+
+
+def _bench_encoding(count: int, repeat: int) -> None:
+    from fastapi import FastAPI
+    from pydantic import TypeAdapter
+
+    from backend.app.api.responses import json_response
+    from backend.app.core.types import CompareItemResult, CompareResponse, PromptMeta
+
+    metas = [
+        PromptMeta(id=f"prompt_{idx:05d}", name=f"Prompt {idx}", tags=["bench", "catalog"], updated_at="2025-12-17")
+        for idx in range(count)
+    ]
+    long_output = "The answer, in detail:\n" + "Lorem ipsum dolor sit amet. " * 20000
+    compare = CompareResponse(
+        model="llama3:latest",
+        input="Explain.",
+        results=[
+            CompareItemResult(prompt_id="a", prompt_name="A", assistant_output=long_output, latency_ms=1),
+            CompareItemResult(prompt_id="b", prompt_name="B", assistant_output=long_output, latency_ms=1),
+        ],
+    )
+    list_adapter = TypeAdapter(Dict[str, List[PromptMeta]])
+    compare_adapter = TypeAdapter(CompareResponse)
+
+    # "before" is FastAPI's default response_model path, exactly as the routes used it.
+    app = FastAPI()
+
+    @app.get("/before/prompts", response_model=Dict[str, List[PromptMeta]])
+    async def before_prompts():
+        return {"prompts": metas}
+
+    @app.get("/after/prompts", response_model=Dict[str, List[PromptMeta]])
+    async def after_prompts():
+        return json_response(list_adapter, {"prompts": metas})
+
+    @app.get("/before/compare", response_model=CompareResponse)
+    async def before_compare():
+        return compare
+
+    @app.get("/after/compare", response_model=CompareResponse)
+    async def after_compare():
+        return json_response(compare_adapter, compare)
+
+    print(f"\nserialization only ({count} PromptMeta, 2 x {len(long_output)} char outputs), median of {repeat}")
+    for name in ("prompts", "compare"):
+        for variant in ("before", "after"):
+            totals = [asyncio.run(_asgi_get(app, f"/{variant}/{name}", {}))[1] for _ in range(repeat)]
+            print(f"  {name:<8} {variant:<6} {_median_ms(totals):8.1f} ms")
+
+
+def _bench_endpoints(repeat: int) -> None:
+    from backend.app.main import create_app
+
+    app = create_app()
+    cases = [
+        ("GET /prompts json identity", "/prompts", {"accept-encoding": "identity"}),
+        ("GET /prompts json gzip", "/prompts", {"accept-encoding": "gzip"}),
+        ("GET /prompts json br", "/prompts", {"accept-encoding": "br"}),
+        ("GET /prompts ndjson identity", "/prompts", {"accept": "application/x-ndjson", "accept-encoding": "identity"}),
+        ("GET /prompts ndjson gzip", "/prompts", {"accept": "application/x-ndjson", "accept-encoding": "gzip"}),
+        ("GET /prompts/{id} identity", "/prompts/prompt_00042", {"accept-encoding": "identity"}),
+        ("GET /prompts/{id} gzip", "/prompts/prompt_00042", {"accept-encoding": "gzip"}),
+    ]
+    print(f"\nend to end against the on-disk catalog, median of {repeat}")
+    print(f"  {'case':<32} {'first byte':>12} {'total':>10} {'bytes':>10}")
+    for label, path, headers in cases:
+        samples = [asyncio.run(_asgi_get(app, path, headers)) for _ in range(repeat)]
+        ttfb = _median_ms([sample[0] for sample in samples])
+        total = _median_ms([sample[1] for sample in samples])
+        size = samples[-1][2]
+        print(f"  {label:<32} {ttfb:9.1f} ms {total:7.1f} ms {size:10d}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--prompts", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    _bench_encoding(args.prompts, args.repeat)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        prompts_dir = Path(tmp)
+        _write_catalog(prompts_dir, args.prompts)
+        os.environ["PROMPTS_DIR"] = str(prompts_dir)
+        _bench_endpoints(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,8 @@ import {
   CompareRequest,
   CompareResponse,
   ModelInfo,
+  PromptChangeEvent,
+  PromptChangeType,
   PromptMeta,
   PromptTemplate,
 } from './types';
@@ -189,3 +191,26 @@ export async function deletePrompt(id: string): Promise<void> {
 
   await parseJsonResponse(response, 'Failed to delete prompt');
 }
+
+const PROMPT_CHANGE_TYPES: PromptChangeType[] = ['created', 'modified', 'deleted', 'reset'];
+
+// Subscribes to the prompt catalog change feed. EventSource reconnects on its own and
+// resumes from the last received token; a 'reset' event means the catalog must be reloaded.
+export function subscribePromptChanges(
+  onChange: (event: PromptChangeEvent) => void,
+  onError?: (event: Event) => void,
+): () => void {
+  const source = new EventSource(`${API_BASE}/prompts/changes`);
+  const handleMessage = (message: MessageEvent<string>) => {
+    try {
+      onChange(JSON.parse(message.data) as PromptChangeEvent);
+    } catch (err) {
+      // Ignore malformed frames; the next event or a reset will resync the catalog.
+    }
+  };
+  PROMPT_CHANGE_TYPES.forEach((type) => source.addEventListener(type, handleMessage as EventListener));
+  if (onError) {
+    source.onerror = onError;
+  }
+  return () => source.close();
+}
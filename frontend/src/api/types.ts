@@ -23,6 +23,7 @@ export type ChatResponse = {
   assistant_output: string;
   model: string;
   latency_ms?: number;
+  queue_ms?: number;
 };
 
 export type CompareRequest = {
@@ -39,6 +40,7 @@ export type CompareItemResult = {
   assistant_output?: string | null;
   error?: string | null;
   latency_ms?: number;
+  queue_ms?: number;
 };
 
 export type CompareResponse = {
@@ -62,3 +64,13 @@ export type PromptTemplate = {
   body_md: string;
   updated_at?: string;
 };
+
+export type PromptChangeType = 'created' | 'modified' | 'deleted' | 'reset';
+
+export type PromptChangeEvent = {
+  seq: number;
+  token: string;
+  type: PromptChangeType;
+  prompt_id?: string | null;
+  prompt?: PromptMeta | null;
+};
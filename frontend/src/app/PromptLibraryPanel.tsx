@@ -1,14 +1,20 @@
 'use client';
 
-import React, { useCallback, useEffect, useState } from 'react';
+import React, { useCallback, useEffect, useRef, useState } from 'react';
 import {
   createPrompt,
   deletePrompt,
   getPrompt,
   listPrompts,
+  subscribePromptChanges,
   updatePrompt,
 } from '../api/client';
-import type { GenerationParams, PromptMeta, PromptTemplate } from '../api/types';
+import type {
+  GenerationParams,
+  PromptChangeEvent,
+  PromptMeta,
+  PromptTemplate,
+} from '../api/types';
 
 type PromptLibraryPanelProps = {
   onApplyPrompt: (body: string, name?: string) => void;
@@ -67,6 +73,28 @@ function parseIntOrUndefined(value: string): number | undefined {
   return Number.isFinite(parsed) ? parsed : undefined;
 }
 
+// Mirrors the server, which lists prompts by sorting `<id>.md` file names in code-point order.
+function comparePromptFiles(a: PromptMeta, b: PromptMeta): number {
+  const left = `${a.id}.md`;
+  const right = `${b.id}.md`;
+  if (left === right) return 0;
+  return left < right ? -1 : 1;
+}
+
+function applyPromptChange(prompts: PromptMeta[], change: PromptChangeEvent): PromptMeta[] {
+  if (!change.prompt_id) return prompts;
+  if (change.type === 'deleted' || !change.prompt) {
+    return prompts.filter((prompt) => prompt.id !== change.prompt_id);
+  }
+  const updated = change.prompt;
+  if (prompts.some((prompt) => prompt.id === updated.id)) {
+    return prompts.map((prompt) => (prompt.id === updated.id ? updated : prompt));
+  }
+  const insertAt = prompts.findIndex((prompt) => comparePromptFiles(updated, prompt) < 0);
+  if (insertAt === -1) return [...prompts, updated];
+  return [...prompts.slice(0, insertAt), updated, ...prompts.slice(insertAt)];
+}
+
 function parseTags(value: string): string[] {
   return value
     .split(',')
@@ -112,6 +140,21 @@ export function PromptLibraryPanel({ onApplyPrompt }: PromptLibraryPanelProps) {
     loadPrompts(query);
   }, [loadPrompts, query]);
 
+  const queryRef = useRef(query);
+  queryRef.current = query;
+
+  useEffect(() => {
+    return subscribePromptChanges((change) => {
+      const currentQuery = queryRef.current;
+      // Search filtering happens on the server, so filtered views and resets reload the list.
+      if (change.type === 'reset' || currentQuery) {
+        loadPrompts(currentQuery);
+        return;
+      }
+      setPrompts((current) => applyPromptChange(current, change));
+    });
+  }, [loadPrompts]);
+
   const handleSelect = async (promptId: string) => {
     setSelectedId(promptId);
     setSelectedPrompt(null);